@@ -0,0 +1,208 @@
+"""
+Blob Store - Shared content-addressed cache of compressed skill files
+
+Files are keyed by the SHA-256 of their contents and stored as raw deflate
+streams, exactly as they appear inside a .skill (zip) entry. When several
+skills bundle the same fonts, logos or templates, the packager compresses
+each distinct file once and raw-copies the cached stream into every archive.
+
+Usage:
+    python3 scripts/package_skill.py <path/to/skill-folder> [output-directory] --blob-store <store-dir>
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+# write_file reaches into zipfile internals; only use the raw path on the
+# CPython versions it was written against and fall back to zipf.write elsewhere
+RAW_WRITE_VERSIONS = ((3, 8), (3, 13))
+
+
+class BlobStore:
+    """
+    Directory of deflate-compressed blobs keyed by content hash.
+
+    Layout: <root>/<first two hex digits>/<sha256>.deflate, plus
+    compression-rate.json with the compression throughput seen so far
+
+    Args:
+        root: Directory holding the blobs (created if missing)
+    """
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.raw_bytes = 0
+        self.deduped_bytes = 0
+        self.compress_seconds = 0.0
+        self.compressed_raw_bytes = 0
+
+        # Throughput measured by earlier runs, so a fully cached batch can still
+        # estimate the compression time it avoided
+        self.previous_seconds = 0.0
+        self.previous_raw_bytes = 0
+        try:
+            rate = json.loads(self._rate_path().read_text())
+            self.previous_seconds = float(rate['seconds'])
+            self.previous_raw_bytes = int(rate['raw_bytes'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _rate_path(self):
+        return self.root / 'compression-rate.json'
+
+    def _blob_path(self, digest):
+        return self.root / digest[:2] / f"{digest}.deflate"
+
+    def _write_atomic(self, path, content):
+        # Write atomically so concurrent packagers never read a partial file
+        path.parent.mkdir(exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(temp_name, path)
+        except OSError:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _blob_matches(compressed, data):
+        # A truncated or corrupted blob must never reach an archive: inflate it
+        # and compare size and CRC (much cheaper than compressing again)
+        decompressor = zlib.decompressobj(-15)
+        try:
+            inflated = decompressor.decompress(compressed)
+        except zlib.error:
+            return False
+        return (
+            decompressor.eof and not decompressor.unused_data
+            and len(inflated) == len(data) and zlib.crc32(inflated) == zlib.crc32(data)
+        )
+
+    def get_compressed(self, data):
+        """
+        Return the raw deflate stream for data, compressing it only on a cache miss.
+
+        A cached blob that does not inflate back to data counts as a miss and is rewritten.
+
+        Args:
+            data: File contents
+
+        Returns:
+            Compressed bytes
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        self.raw_bytes += len(data)
+
+        if blob_path.exists():
+            compressed = blob_path.read_bytes()
+            if self._blob_matches(compressed, data):
+                self.hits += 1
+                self.deduped_bytes += len(data)
+                return compressed
+
+        self.misses += 1
+        start = time.perf_counter()
+        # Same settings zipfile uses for ZIP_DEFLATED, so entries are byte-identical
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        self.compress_seconds += time.perf_counter() - start
+        self.compressed_raw_bytes += len(data)
+
+        self._write_atomic(blob_path, compressed)
+        return compressed
+
+    def write_file(self, zipf, file_path, arcname):
+        """
+        Add file_path to an open ZipFile as a deflated entry using a cached stream.
+
+        Produces the same bytes as ``zipf.write(file_path, arcname)`` with ZIP_DEFLATED.
+        Files that need zip64 sizes, and Python versions outside RAW_WRITE_VERSIONS,
+        are handed to ``zipf.write`` (bypassing the store).
+
+        Raises:
+            ValueError: If zipf was not opened in 'w' mode
+        """
+        if zipf.mode != 'w':
+            raise ValueError(f"BlobStore.write_file requires a ZipFile opened in 'w' mode, got '{zipf.mode}'")
+
+        oldest, newest = RAW_WRITE_VERSIONS
+        # Same margin zipfile uses to decide on zip64 headers before compressing
+        if (not oldest <= sys.version_info[:2] <= newest
+                or Path(file_path).stat().st_size * 1.05 > zipfile.ZIP64_LIMIT):
+            zipf.write(file_path, arcname, zipfile.ZIP_DEFLATED)
+            return
+
+        data = Path(file_path).read_bytes()
+        compressed = self.get_compressed(data)
+
+        zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = zlib.crc32(data)
+
+        # zipfile has no public raw-write API: append the local header and
+        # stream ourselves, then register the entry for the central directory,
+        # mirroring ZipFile.writestr. Relies on zipfile internals (_writing,
+        # _writecheck, _lock, _didModify, fp, start_dir).
+        if zipf._writing:
+            raise ValueError("Can't write to ZIP archive while an open writing handle exists")
+        zipf._writecheck(zinfo)
+        with zipf._lock:
+            zipf.fp.seek(zipf.start_dir)
+            zinfo.header_offset = zipf.fp.tell()
+            zipf.fp.write(zinfo.FileHeader(False))
+            zipf.fp.write(compressed)
+            zipf.filelist.append(zinfo)
+            zipf.NameToInfo[zinfo.filename] = zinfo
+            zipf.start_dir = zipf.fp.tell()
+            zipf._didModify = True
+
+    def dedupe_ratio(self):
+        """Fraction of packaged bytes served from the store instead of compressed."""
+        return self.deduped_bytes / self.raw_bytes if self.raw_bytes else 0.0
+
+    def estimated_seconds_saved(self):
+        """
+        Compression time avoided, estimated from the throughput observed on misses
+        in this and earlier runs.
+
+        Returns:
+            Seconds, or None if no compression has ever been measured for this store
+        """
+        raw_bytes = self.previous_raw_bytes + self.compressed_raw_bytes
+        seconds = self.previous_seconds + self.compress_seconds
+        if not raw_bytes:
+            return None
+        return self.deduped_bytes * seconds / raw_bytes
+
+    def save_rate(self):
+        """Persist the accumulated compression throughput for later runs."""
+        if not self.compressed_raw_bytes:
+            return
+        rate = {
+            'raw_bytes': self.previous_raw_bytes + self.compressed_raw_bytes,
+            'seconds': self.previous_seconds + self.compress_seconds,
+        }
+        self._write_atomic(self._rate_path(), json.dumps(rate).encode('utf-8'))
+
+    def summary(self):
+        seconds_saved = self.estimated_seconds_saved()
+        saved = "n/a" if seconds_saved is None else f"~{seconds_saved:.3f}s"
+        return (
+            f"{self.hits} reused / {self.misses} compressed file(s), "
+            f"dedupe ratio {self.dedupe_ratio():.1%} of {self.raw_bytes} bytes, "
+            f"{saved} compression saved"
+        )
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Changed Skills - Finds skill folders touched since a base git revision
+
+Reads the local git repository only (no hosted service), so it works offline
+in CI checkouts that have the base revision fetched.
+
+Usage:
+    python3 scripts/changed_skills.py <path/to/skills-folder> <base-revision> [--shared PATH ...]
+
+Example:
+    python3 scripts/changed_skills.py skills/public origin/main --shared skills/templates
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def find_skills(library_path):
+    """Return the skill folders (direct children containing SKILL.md) of a library, sorted by name."""
+    library_path = Path(library_path).resolve()
+    return sorted(child for child in library_path.iterdir() if (child / 'SKILL.md').is_file())
+
+
+def _git(repo_path, *args):
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(repo_path), *args],
+            check=True, capture_output=True, text=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError("git executable not found")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git {' '.join(args)} failed: {e.stderr.strip()}")
+    return result.stdout
+
+
+def changed_files(repo_path, base_rev):
+    """
+    List files changed since the merge base of base_rev and HEAD.
+
+    Includes committed, staged, unstaged and untracked (non-ignored) changes.
+
+    Args:
+        repo_path: Any path inside the git repository
+        base_rev: Base revision, e.g. 'origin/main'
+
+    Returns:
+        Set of absolute Paths
+    """
+    toplevel = Path(_git(repo_path, 'rev-parse', '--show-toplevel').strip())
+    merge_base = _git(toplevel, 'merge-base', base_rev, 'HEAD').strip()
+
+    # --no-renames lists both sides of a move, so the source skill is selected too
+    names = _git(toplevel, 'diff', '--name-only', '--no-renames', '-z', merge_base, '--').split('\0')
+    names += _git(toplevel, 'ls-files', '--others', '--exclude-standard', '-z').split('\0')
+    return {(toplevel / name).resolve() for name in names if name}
+
+
+def changed_skills(library_path, base_rev, shared_paths=()):
+    """
+    Select the skills in a library affected by changes since base_rev.
+
+    A skill is selected when any file inside its folder changed. If a shared
+    path (templates, rule plugins, or these scripts) changed, every skill is
+    selected since any of them may depend on it.
+
+    Args:
+        library_path: Folder whose direct children are skill folders
+        base_rev: Base revision to compare against
+        shared_paths: Files or folders that all skills depend on
+
+    Returns:
+        Sorted list of skill folder Paths that still exist
+    """
+    library_path = Path(library_path).resolve()
+    skills = find_skills(library_path)
+    changed = changed_files(library_path, base_rev)
+
+    shared = [Path(path).resolve() for path in shared_paths] + [SCRIPTS_DIR]
+    if any(path == root or root in path.parents for path in changed for root in shared):
+        return skills
+
+    return [skill for skill in skills if any(skill in path.parents for path in changed)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List skill folders changed since a base git revision")
+    parser.add_argument('library_path', help="Folder containing skill folders")
+    parser.add_argument('base_rev', help="Base revision, e.g. origin/main")
+    parser.add_argument('--shared', action='append', default=[], metavar='PATH',
+                        help="Shared template or rule path; a change selects every skill (repeatable)")
+    args = parser.parse_args()
+
+    try:
+        skills = changed_skills(args.library_path, args.base_rev, args.shared)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for skill in skills:
+        print(skill)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,25 +4,33 @@ Skill Packager - Creates a distributable .skill file of a skill folder
 
 Usage:
     python3 scripts/package_skill.py <path/to/skill-folder> [output-directory]
+    python3 scripts/package_skill.py <path/to/skills-folder> [output-directory] --changed-since <base-revision>
+    python3 scripts/package_skill.py <path/to/skill-folder> [output-directory] --blob-store <store-dir>
 
 Example:
     python3 scripts/package_skill.py skills/public/my-skill
     python3 scripts/package_skill.py skills/public/my-skill ./dist
+    python3 scripts/package_skill.py skills/public ./dist --changed-since origin/main
+    python3 scripts/package_skill.py skills/public ./dist --changed-since origin/main --blob-store .blob-cache
 """
 
+import argparse
 import sys
 import zipfile
 from pathlib import Path
 from quick_validate import validate_skill
+from changed_skills import changed_skills
+from blob_store import BlobStore
 
 
-def package_skill(skill_path, output_dir=None):
+def package_skill(skill_path, output_dir=None, blob_store=None):
     """
     Package a skill folder into a .skill file.
 
     Args:
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
+        blob_store: Optional BlobStore; files already in it are raw-copied instead of recompressed
 
     Returns:
         Path to the created .skill file, or None if error
@@ -71,7 +79,10 @@ def package_skill(skill_path, output_dir=None):
                 if file_path.is_file():
                     # Calculate the relative path within the zip
                     arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
+                    if blob_store is not None:
+                        blob_store.write_file(zipf, file_path, arcname)
+                    else:
+                        zipf.write(file_path, arcname)
                     print(f"  Added: {arcname}")
 
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
@@ -83,28 +94,55 @@ def package_skill(skill_path, output_dir=None):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 scripts/package_skill.py <path/to/skill-folder> [output-directory]")
-        print("\nExample:")
-        print("  python3 scripts/package_skill.py .claude/skills/brainstorming")
-        print("  python3 scripts/package_skill.py .claude/skills/brainstorming ./dist")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="Package a skill folder into a distributable .skill file",
+        epilog=(
+            "Examples:\n"
+            "  python3 scripts/package_skill.py .claude/skills/brainstorming\n"
+            "  python3 scripts/package_skill.py .claude/skills/brainstorming ./dist\n"
+            "  python3 scripts/package_skill.py .claude/skills ./dist --changed-since origin/main"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('skill_path',
+                        help="Path to the skill folder (or the skills folder with --changed-since)")
+    parser.add_argument('output_dir', nargs='?', help="Output directory (defaults to current directory)")
+    parser.add_argument('--changed-since', metavar='REV',
+                        help="Package only skills changed since REV in the local git repository")
+    parser.add_argument('--shared', action='append', default=[], metavar='PATH',
+                        help="With --changed-since, a shared path whose change selects every skill (repeatable)")
+    parser.add_argument('--blob-store', metavar='DIR',
+                        help="Shared content-addressed store; identical files are compressed once across skills")
+    args = parser.parse_args()
+
+    if args.changed_since:
+        try:
+            skill_paths = changed_skills(args.skill_path, args.changed_since, args.shared)
+        except (OSError, RuntimeError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"🔎 {len(skill_paths)} skill(s) changed since {args.changed_since}\n")
+    else:
+        skill_paths = [args.skill_path]
 
-    skill_path = sys.argv[1]
-    output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    blob_store = BlobStore(args.blob_store) if args.blob_store else None
 
-    print(f"📦 Packaging skill: {skill_path}")
-    if output_dir:
-        print(f"   Output directory: {output_dir}")
-    print()
+    all_packaged = True
+    for skill_path in skill_paths:
+        print(f"📦 Packaging skill: {skill_path}")
+        if args.output_dir:
+            print(f"   Output directory: {args.output_dir}")
+        print()
 
-    result = package_skill(skill_path, output_dir)
+        if not package_skill(skill_path, args.output_dir, blob_store):
+            all_packaged = False
 
-    if result:
-        sys.exit(0)
-    else:
-        sys.exit(1)
+    if blob_store:
+        blob_store.save_rate()
+        print(f"\n🗄️  Blob store: {blob_store.summary()}")
+
+    sys.exit(0 if all_packaged else 1)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,19 +1,309 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Checks are registered as rule objects and evaluated in a single pass over the
+parsed frontmatter. Rules can be grouped into rule sets, downgraded to
+warnings, and extended with organization-specific plugins.
+
+Usage:
+    quick_validate.py <path/to/skill-folder> [--rule-set NAME] [--warn RULE_ID]
+                      [--plugin PATH] [--profile]
+    quick_validate.py <path/to/skills-folder> --changed-since <base-revision> [--shared PATH]
 """
 
-import sys
+import argparse
+import importlib.util
 import re
+import sys
+import time
 import yaml
 from pathlib import Path
+from changed_skills import changed_skills
+
+FRONTMATTER_PATTERN = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+NAME_PATTERN = re.compile(r'^[a-z0-9-]+$')
+
+# Define allowed properties (required: name, description)
+ALLOWED_PROPERTIES = frozenset({'name', 'description', 'license', 'allowed-tools', 'metadata'})
+RESERVED_NAMES = frozenset({'anthropic-helper', 'claude-tools'})
+RESERVED_SEGMENTS = frozenset({'anthropic', 'claude'})
+MAX_NAME_LENGTH = 64
+MAX_DESCRIPTION_LENGTH = 1024
+
+SEVERITIES = ('error', 'warning')
 
-def validate_skill(skill_path):
+
+class Rule:
+    """
+    A single validation check.
+
+    Args:
+        rule_id: Unique identifier used for rule sets and severity overrides
+        check: Callable taking a SkillContext and returning an error message or None
+        severity: 'error' fails validation, 'warning' is reported only
+    """
+
+    def __init__(self, rule_id, check, severity='error'):
+        if severity not in SEVERITIES:
+            raise ValueError(f"Unknown severity '{severity}' for rule '{rule_id}'")
+        self.rule_id = rule_id
+        self.check = check
+        self.severity = severity
+
+    def with_severity(self, severity):
+        return Rule(self.rule_id, self.check, severity)
+
+    def __repr__(self):
+        return f"Rule({self.rule_id!r}, severity={self.severity!r})"
+
+
+class SkillContext:
+    """Parsed frontmatter plus the values shared by several rules, computed once."""
+
+    def __init__(self, skill_path, frontmatter):
+        self.skill_path = skill_path
+        self.frontmatter = frontmatter
+
+        name = frontmatter.get('name')
+        # Name-based rules only run once the name is a non-empty string
+        self.name = name.strip() if isinstance(name, str) and name.strip() else None
+        self.segments = [segment for segment in self.name.split('-') if segment] if self.name else []
+
+        description = frontmatter.get('description')
+        self.description = description.strip() if isinstance(description, str) else None
+
+
+# Built-in rules, in evaluation order
+RULES = {}
+
+
+def rule(rule_id, severity='error'):
+    """Register a check function as a built-in rule."""
+    def decorator(check):
+        RULES[rule_id] = Rule(rule_id, check, severity)
+        return check
+    return decorator
+
+
+@rule('allowed-keys')
+def check_allowed_keys(ctx):
+    # Check for unexpected properties (excluding nested keys under metadata)
+    unexpected_keys = set(ctx.frontmatter.keys()) - ALLOWED_PROPERTIES
+    if unexpected_keys:
+        return (
+            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
+            f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
+        )
+    return None
+
+
+@rule('required-fields')
+def check_required_fields(ctx):
+    name = ctx.frontmatter.get('name')
+    if 'name' not in ctx.frontmatter or (isinstance(name, str) and not name.strip()):
+        return "Missing 'name' in frontmatter"
+    if 'description' not in ctx.frontmatter:
+        return "Missing 'description' in frontmatter"
+    return None
+
+
+@rule('name-type')
+def check_name_type(ctx):
+    if 'name' in ctx.frontmatter and not isinstance(ctx.frontmatter['name'], str):
+        return f"Name must be a string, got {type(ctx.frontmatter['name']).__name__}"
+    return None
+
+
+@rule('name-format')
+def check_name_format(ctx):
+    # Check naming convention (hyphen-case: lowercase with hyphens)
+    if ctx.name and not NAME_PATTERN.match(ctx.name):
+        return f"Name '{ctx.name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+    return None
+
+
+@rule('name-hyphens')
+def check_name_hyphens(ctx):
+    name = ctx.name
+    if name and (name.startswith('-') or name.endswith('-') or '--' in name):
+        return f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
+    return None
+
+
+@rule('name-length')
+def check_name_length(ctx):
+    # Check name length (max 64 characters per spec)
+    if ctx.name and len(ctx.name) > MAX_NAME_LENGTH:
+        return f"Name is too long ({len(ctx.name)} characters). Maximum is {MAX_NAME_LENGTH} characters."
+    return None
+
+
+@rule('name-segments')
+def check_name_segments(ctx):
+    if ctx.name and not ctx.segments:
+        return "Name must include at least one segment"
+    return None
+
+
+@rule('gerund-name')
+def check_gerund_name(ctx):
+    if ctx.segments and not ctx.segments[0].endswith('ing'):
+        return "Name should use gerund form (verb + -ing) for the first segment"
+    return None
+
+
+@rule('reserved-words')
+def check_reserved_words(ctx):
+    if ctx.name in RESERVED_NAMES:
+        return f"Name '{ctx.name}' is reserved and cannot be used"
+    if any(segment in RESERVED_SEGMENTS for segment in ctx.segments):
+        return "Name cannot contain reserved words: anthropic, claude"
+    return None
+
+
+@rule('directory-match')
+def check_directory_match(ctx):
+    if ctx.name and ctx.skill_path.name != ctx.name:
+        return f"Name '{ctx.name}' must match directory name '{ctx.skill_path.name}' exactly"
+    return None
+
+
+@rule('description-type')
+def check_description_type(ctx):
+    description = ctx.frontmatter.get('description')
+    if 'description' in ctx.frontmatter and not isinstance(description, str):
+        return f"Description must be a string, got {type(description).__name__}"
+    return None
+
+
+@rule('description-brackets')
+def check_description_brackets(ctx):
+    if ctx.description and ('<' in ctx.description or '>' in ctx.description):
+        return "Description cannot contain angle brackets (< or >)"
+    return None
+
+
+@rule('description-length')
+def check_description_length(ctx):
+    # Check description length (max 1024 characters per spec)
+    if ctx.description and len(ctx.description) > MAX_DESCRIPTION_LENGTH:
+        return (
+            f"Description is too long ({len(ctx.description)} characters). "
+            f"Maximum is {MAX_DESCRIPTION_LENGTH} characters."
+        )
+    return None
+
+
+RULE_SETS = {
+    'default': tuple(RULES),
+    # Agent Skills spec only; drops this project's gerund naming convention
+    'spec': tuple(rule_id for rule_id in RULES if rule_id != 'gerund-name'),
+}
+
+
+def load_plugin(plugin_path):
+    """
+    Load organization-specific rules from a Python file.
+
+    The plugin module must define a ``RULES`` iterable of Rule objects.
+    """
+    plugin_path = Path(plugin_path).resolve()
+    if not plugin_path.is_file():
+        raise ValueError(f"Rule plugin not found: {plugin_path}")
+
+    # When run as a script this module is __main__; alias it so a plugin's
+    # `from quick_validate import Rule` resolves to the same Rule class
+    sys.modules.setdefault('quick_validate', sys.modules[__name__])
+
+    spec = importlib.util.spec_from_file_location(f"skill_rules_{plugin_path.stem}", plugin_path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception as e:
+        raise ValueError(f"Rule plugin {plugin_path.name} failed to load: {type(e).__name__}: {e}")
+
+    plugin_rules = list(getattr(module, 'RULES', []))
+    for plugin_rule in plugin_rules:
+        if not isinstance(plugin_rule, Rule):
+            raise ValueError(f"Rule plugin {plugin_path.name} exports a non-Rule object: {plugin_rule!r}")
+    return plugin_rules
+
+
+def select_rules(rule_set='default', severities=None, plugins=()):
+    """
+    Build the ordered list of rules to evaluate.
+
+    Args:
+        rule_set: Name of a built-in rule set (see RULE_SETS)
+        severities: Optional mapping of rule_id to 'error' or 'warning'
+        plugins: Paths to plugin files whose rules run after the built-in ones
+
+    Returns:
+        List of Rule objects
+    """
+    if rule_set not in RULE_SETS:
+        raise ValueError(f"Unknown rule set '{rule_set}'. Available: {', '.join(sorted(RULE_SETS))}")
+
+    selected = [RULES[rule_id] for rule_id in RULE_SETS[rule_set]]
+    # Built-in ids stay reserved even when the rule set leaves them out
+    seen_ids = set(RULES)
+    for plugin_path in plugins:
+        for plugin_rule in load_plugin(plugin_path):
+            if plugin_rule.rule_id in seen_ids:
+                raise ValueError(
+                    f"Rule plugin {Path(plugin_path).name} redefines rule id '{plugin_rule.rule_id}'"
+                )
+            seen_ids.add(plugin_rule.rule_id)
+            selected.append(plugin_rule)
+
+    severities = severities or {}
+    known_ids = {selected_rule.rule_id for selected_rule in selected}
+    unknown_ids = set(severities) - known_ids
+    if unknown_ids:
+        raise ValueError(f"Unknown rule id(s): {', '.join(sorted(unknown_ids))}")
+
+    return [
+        selected_rule.with_severity(severities[selected_rule.rule_id])
+        if selected_rule.rule_id in severities else selected_rule
+        for selected_rule in selected
+    ]
+
+
+def run_rules(ctx, rules, timings=None):
+    """
+    Evaluate rules against a parsed skill in one pass.
+
+    Args:
+        ctx: SkillContext for the skill
+        rules: Ordered list of Rule objects
+        timings: Optional dict that accumulates seconds spent per rule_id
+
+    Returns:
+        List of (rule, message) findings in rule order
+    """
+    findings = []
+    for current_rule in rules:
+        if timings is None:
+            message = current_rule.check(ctx)
+        else:
+            start = time.perf_counter()
+            message = current_rule.check(ctx)
+            timings[current_rule.rule_id] = timings.get(current_rule.rule_id, 0.0) + time.perf_counter() - start
+        if message:
+            findings.append((current_rule, message))
+    return findings
+
+
+def validate_skill(skill_path, rules=None, timings=None, warnings=None):
     """
     Basic validation of a skill
 
     Args:
         skill_path: Path to the skill folder
+        rules: Optional list of Rule objects (defaults to the 'default' rule set)
+        timings: Optional dict that accumulates seconds spent per rule_id
+        warnings: Optional list that collects messages from warning-severity rules
     """
     skill_path = Path(skill_path).resolve()
 
@@ -35,7 +325,7 @@ def validate_skill(skill_path):
         return False, "No YAML frontmatter found"
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_PATTERN.match(content)
     if not match:
         return False, "Invalid frontmatter format"
 
@@ -49,85 +339,84 @@ def validate_skill(skill_path):
     except yaml.YAMLError as e:
         return False, f"Invalid YAML in frontmatter: {e}"
 
-    # Define allowed properties (required: name, description)
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+    if rules is None:
+        rules = select_rules()
 
-    # Check for unexpected properties (excluding nested keys under metadata)
-    unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
-    if unexpected_keys:
-        return False, (
-            f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
-            f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
-        )
+    findings = run_rules(SkillContext(skill_path, frontmatter), rules, timings)
+    errors = [message for found_rule, message in findings if found_rule.severity == 'error']
+    if warnings is not None:
+        warnings.extend(message for found_rule, message in findings if found_rule.severity == 'warning')
 
-    # Check required fields
-    if 'name' not in frontmatter:
-        return False, "Missing 'name' in frontmatter"
-    if 'description' not in frontmatter:
-        return False, "Missing 'description' in frontmatter"
+    if errors:
+        return False, errors[0]
 
-    # Extract name for validation
-    name = frontmatter.get('name', '')
-    if not isinstance(name, str):
-        return False, f"Name must be a string, got {type(name).__name__}"
-    name = name.strip()
-    if not name:
-        return False, "Missing 'name' in frontmatter"
+    return True, "Skill is valid!"
 
-    # Check naming convention (hyphen-case: lowercase with hyphens)
-    if not re.match(r'^[a-z0-9-]+$', name):
-        return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
-    if name.startswith('-') or name.endswith('-') or '--' in name:
-        return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
-    # Check name length (max 64 characters per spec)
-    if len(name) > 64:
-        return False, f"Name is too long ({len(name)} characters). Maximum is 64 characters."
-
-    segments = [segment for segment in name.split('-') if segment]
-    if not segments:
-        return False, "Name must include at least one segment"
-
-    if not segments[0].endswith('ing'):
-        return False, "Name should use gerund form (verb + -ing) for the first segment"
-
-    reserved_names = {'anthropic-helper', 'claude-tools'}
-    reserved_segments = {'anthropic', 'claude'}
-
-    if name in reserved_names:
-        return False, f"Name '{name}' is reserved and cannot be used"
-    if any(segment in reserved_segments for segment in segments):
-        return False, "Name cannot contain reserved words: anthropic, claude"
-    if skill_path.name != name:
-        return False, f"Name '{name}' must match directory name '{skill_path.name}' exactly"
-
-    # Extract and validate description
-    description = frontmatter.get('description', '')
-    if not isinstance(description, str):
-        return False, f"Description must be a string, got {type(description).__name__}"
-    description = description.strip()
-    if description:
-        # Check for angle brackets
-        if '<' in description or '>' in description:
-            return False, "Description cannot contain angle brackets (< or >)"
-        # Check description length (max 1024 characters per spec)
-        if len(description) > 1024:
-            return False, f"Description is too long ({len(description)} characters). Maximum is 1024 characters."
 
-    return True, "Skill is valid!"
+def main():
+    parser = argparse.ArgumentParser(
+        description="Quick validation of a skill folder",
+        epilog=(
+            "Examples:\n"
+            "  python3 ./scripts/quick_validate.py .claude/skills/brainstorming\n"
+            "  python3 ./scripts/quick_validate.py .claude/skills --changed-since origin/main"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('skill_path',
+                        help="Path to the skill folder (or the skills folder with --changed-since)")
+    parser.add_argument('--rule-set', default='default', choices=sorted(RULE_SETS),
+                        help="Built-in rule set to evaluate (default: default)")
+    parser.add_argument('--warn', action='append', default=[], metavar='RULE_ID',
+                        help="Report RULE_ID as a warning instead of an error (repeatable)")
+    parser.add_argument('--plugin', action='append', default=[], metavar='PATH',
+                        help="Python file exporting extra RULES (repeatable)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Print a per-rule timing breakdown")
+    parser.add_argument('--changed-since', metavar='REV',
+                        help="Validate only skills changed since REV in the local git repository")
+    parser.add_argument('--shared', action='append', default=[], metavar='PATH',
+                        help="With --changed-since, a shared path whose change selects every skill (repeatable)")
+    args = parser.parse_args()
 
-if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python3 ./scripts/quick_validate.py <path/to/skill-folder>")
-        print("\nExample:")
-        print("  python3 ./scripts/quick_validate.py .claude/skills/brainstorming")
+    try:
+        rules = select_rules(args.rule_set, {rule_id: 'warning' for rule_id in args.warn}, args.plugin)
+    except ValueError as e:
+        print(f"❌ {e}")
         sys.exit(1)
 
-    print("🔍 Validating skill...")
-    skill_folder_path = sys.argv[1]
-    valid, message = validate_skill(skill_folder_path)
-    if not valid:
-        print(f"❌ Validation failed: {message}")
-        print("   Please fix the validation errors before continuing.")
+    if args.changed_since:
+        try:
+            skill_paths = changed_skills(args.skill_path, args.changed_since, args.shared + args.plugin)
+        except (OSError, RuntimeError) as e:
+            print(f"❌ Error: {e}")
+            sys.exit(1)
+        print(f"🔎 {len(skill_paths)} skill(s) changed since {args.changed_since}\n")
     else:
-        print(f"✅ {message}\n")
-    sys.exit(0 if valid else 1)
+        skill_paths = [args.skill_path]
+
+    timings = {} if args.profile else None
+    all_valid = True
+    for skill_path in skill_paths:
+        print(f"🔍 Validating skill{f': {skill_path}' if args.changed_since else '...'}")
+        warnings = []
+        valid, message = validate_skill(skill_path, rules, timings, warnings)
+        for warning in warnings:
+            print(f"⚠️  Warning: {warning}")
+        if not valid:
+            print(f"❌ Validation failed: {message}")
+            print("   Please fix the validation errors before continuing.")
+            all_valid = False
+        else:
+            print(f"✅ {message}\n")
+
+    if timings:
+        print("⏱️  Rule timings:")
+        for rule_id, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+            print(f"  {rule_id:<22} {seconds * 1e6:8.1f} µs")
+
+    sys.exit(0 if all_valid else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Skill Delta - Creates and applies compact deltas between two .skill archives
+
+A delta describes the new archive as a sequence of byte ranges: ranges copied
+from the old archive, new content-defined chunks stored once in the delta
+(keyed by SHA-256), and small inline literals such as local headers and the
+central directory. Unchanged entries and unchanged compressed streams are
+copied as-is from the old archive, and only the entries that changed are
+chunked, so applying a delta never recompresses anything: the rebuilt archive
+is byte-identical regardless of which tool or zlib build produced it. Both
+create and apply check the rebuilt archive's SHA-256 digest.
+
+Chunking is a pure-Python rolling hash and costs roughly 0.3 s per MiB of
+changed entries (old and new side); unchanged entries are never chunked.
+
+Usage:
+    python3 scripts/skill_delta.py create <old.skill> <new.skill> [output.skilldelta]
+    python3 scripts/skill_delta.py apply <old.skill> <delta.skilldelta> [output.skill]
+
+Example:
+    python3 scripts/skill_delta.py create dist/v1/my-skill.skill dist/v2/my-skill.skill
+    python3 scripts/skill_delta.py apply my-skill.skill my-skill.skilldelta my-skill.new.skill
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import struct
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+DELTA_FORMAT = 2
+MANIFEST_NAME = 'manifest.json'
+CHUNKS_DIR = 'chunks/'
+
+# Content-defined chunking bounds (average chunk ~8 KiB)
+MIN_CHUNK_SIZE = 2 * 1024
+MAX_CHUNK_SIZE = 64 * 1024
+CHUNK_MASK = (1 << 13) - 1
+
+# Fixed gear table so every host cuts chunks at the same boundaries
+_GEAR_RANDOM = random.Random(1)
+_GEAR = [_GEAR_RANDOM.getrandbits(64) for _ in range(256)]
+_HASH_MASK = (1 << 64) - 1
+
+# Zip structure signatures and sizes (PKWARE APPNOTE)
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+_LOCAL_HEADER_SIZE = 30
+_END_RECORD_SIGNATURE = b'PK\x05\x06'
+_END_RECORD_SIZE = 22
+_ZIP64_LOCATOR_SIGNATURE = b'PK\x06\x07'
+_ZIP64_LOCATOR_SIZE = 20
+_MAX_COMMENT_SIZE = 0xFFFF
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_boundaries(data):
+    """
+    Split data into content-defined chunks using a gear rolling hash.
+
+    Pure Python (about 0.3 s per MiB), so callers only chunk data that changed.
+
+    Returns:
+        List of (offset, length) tuples covering data
+    """
+    boundaries = []
+    size = len(data)
+    start = 0
+    gear = _GEAR
+    while start < size:
+        end = min(start + MAX_CHUNK_SIZE, size)
+        position = start + MIN_CHUNK_SIZE
+        if position >= end:
+            position = end
+        else:
+            rolling = 0
+            while position < end:
+                rolling = ((rolling << 1) + gear[data[position]]) & _HASH_MASK
+                position += 1
+                if not rolling & CHUNK_MASK:
+                    break
+        boundaries.append((start, position - start))
+        start = position
+    return boundaries
+
+
+class _Record:
+    """Byte layout of one entry: local header, compressed stream, then any data descriptor."""
+
+    def __init__(self, filename, start, data_start, data_end, end):
+        self.filename = filename
+        self.start = start
+        self.data_start = data_start
+        self.data_end = data_end
+        self.end = end
+
+
+def zip_layout(archive_bytes):
+    """
+    Locate every entry's bytes and the central directory in a zip archive.
+
+    Returns:
+        (list of _Record sorted by offset, central directory start offset)
+
+    Raises:
+        ValueError: If the archive is not a zip file or uses zip64 structures
+    """
+    search_start = max(0, len(archive_bytes) - _END_RECORD_SIZE - _MAX_COMMENT_SIZE)
+    end_record = archive_bytes.rfind(_END_RECORD_SIGNATURE, search_start)
+    if end_record < 0:
+        raise ValueError("Not a zip archive (end of central directory not found)")
+    locator = end_record - _ZIP64_LOCATOR_SIZE
+    if locator >= 0 and archive_bytes[locator:locator + 4] == _ZIP64_LOCATOR_SIGNATURE:
+        raise ValueError("zip64 archives are not supported")
+    central_directory_size, = struct.unpack('<I', archive_bytes[end_record + 12:end_record + 16])
+    central_directory_start = end_record - central_directory_size
+
+    with zipfile.ZipFile(io.BytesIO(archive_bytes)) as archive:
+        infos = sorted(archive.infolist(), key=lambda zinfo: zinfo.header_offset)
+
+    records = []
+    for index, zinfo in enumerate(infos):
+        start = zinfo.header_offset
+        if archive_bytes[start:start + 4] != _LOCAL_HEADER_SIGNATURE:
+            raise ValueError(f"Bad local header for {zinfo.filename}")
+        name_length, extra_length = struct.unpack('<HH', archive_bytes[start + 26:start + 30])
+        data_start = start + _LOCAL_HEADER_SIZE + name_length + extra_length
+        end = infos[index + 1].header_offset if index + 1 < len(infos) else central_directory_start
+        records.append(_Record(zinfo.filename, start, data_start, data_start + zinfo.compress_size, end))
+    return records, central_directory_start
+
+
+def _literal(data):
+    return [['data', base64.b64encode(data).decode('ascii')]] if data else []
+
+
+def _merge_ops(ops):
+    # Collapse consecutive copies of adjacent ranges in the old archive
+    merged = []
+    for op in ops:
+        previous = merged[-1] if merged else None
+        if op[0] == 'old' and previous and previous[0] == 'old' and previous[1] + previous[2] == op[1]:
+            previous[2] += op[2]
+        else:
+            merged.append(list(op))
+    return merged
+
+
+def build_delta(old_archive, new_archive):
+    """
+    Compute the delta manifest and new chunks between two archives.
+
+    Returns:
+        (manifest dict, dict of chunk hash -> bytes)
+    """
+    old_bytes = Path(old_archive).read_bytes()
+    new_bytes = Path(new_archive).read_bytes()
+    old_records, _ = zip_layout(old_bytes)
+    new_records, new_central_directory = zip_layout(new_bytes)
+
+    old_by_name = {record.filename: record for record in old_records}
+    old_record_index = {}
+    old_stream_index = {}
+    for record in old_records:
+        old_record_index.setdefault(sha256_bytes(old_bytes[record.start:record.end]), record)
+        old_stream_index.setdefault(sha256_bytes(old_bytes[record.data_start:record.data_end]), record)
+
+    entries = []
+    new_chunks = {}
+    for record in new_records:
+        record_bytes = new_bytes[record.start:record.end]
+        stream = new_bytes[record.data_start:record.data_end]
+        old_record = old_record_index.get(sha256_bytes(record_bytes))
+        old_stream = old_stream_index.get(sha256_bytes(stream))
+
+        if old_record:
+            # Whole entry unchanged: copy header, stream and descriptor
+            status = 'unchanged'
+            ops = [['old', old_record.start, old_record.end - old_record.start]]
+        elif old_stream:
+            # Same compressed stream under a new name or header (e.g. timestamp)
+            status = 'metadata' if record.filename in old_by_name else 'renamed'
+            ops = (_literal(new_bytes[record.start:record.data_start])
+                   + [['old', old_stream.data_start, old_stream.data_end - old_stream.data_start]])
+        else:
+            status = 'modified' if record.filename in old_by_name else 'added'
+            # Only the previous version of this file is chunked for reuse
+            old_chunks = {}
+            previous = old_by_name.get(record.filename)
+            if previous:
+                for offset, length in chunk_boundaries(old_bytes[previous.data_start:previous.data_end]):
+                    chunk_start = previous.data_start + offset
+                    chunk_hash = sha256_bytes(old_bytes[chunk_start:chunk_start + length])
+                    old_chunks.setdefault(chunk_hash, (chunk_start, length))
+
+            ops = _literal(new_bytes[record.start:record.data_start])
+            for offset, length in chunk_boundaries(stream):
+                chunk = stream[offset:offset + length]
+                chunk_hash = sha256_bytes(chunk)
+                if chunk_hash in old_chunks:
+                    ops.append(['old', *old_chunks[chunk_hash]])
+                else:
+                    new_chunks.setdefault(chunk_hash, chunk)
+                    ops.append(['chunk', chunk_hash])
+
+        if status != 'unchanged':
+            # Data descriptor and any padding up to the next entry
+            ops += _literal(new_bytes[record.data_end:record.end])
+
+        entries.append({'filename': record.filename, 'status': status, 'ops': _merge_ops(ops)})
+
+    first_entry = new_records[0].start if new_records else new_central_directory
+    new_names = {record.filename for record in new_records}
+    manifest = {
+        'format': DELTA_FORMAT,
+        'old_sha256': sha256_bytes(old_bytes),
+        'new_sha256': sha256_bytes(new_bytes),
+        'removed': sorted(name for name in old_by_name if name not in new_names),
+        'prefix': _literal(new_bytes[:first_entry]),
+        'entries': entries,
+        # Central directory and end record: small, stored inline
+        'tail': _literal(new_bytes[new_central_directory:]),
+    }
+    return manifest, new_chunks
+
+
+def rebuild_archive(old_archive, delta_path, output_path):
+    """
+    Rebuild the new archive from old_archive and a delta by concatenating byte ranges.
+
+    Raises:
+        ValueError: If the base archive or the rebuilt archive does not match the delta
+    """
+    with zipfile.ZipFile(delta_path) as delta_zip:
+        manifest = json.loads(delta_zip.read(MANIFEST_NAME))
+        if manifest.get('format') != DELTA_FORMAT:
+            raise ValueError(f"Unsupported delta format: {manifest.get('format')}")
+        if sha256_file(old_archive) != manifest['old_sha256']:
+            raise ValueError(f"{Path(old_archive).name} is not the base archive this delta was created from")
+
+        segments = [manifest['prefix']] + [entry['ops'] for entry in manifest['entries']] + [manifest['tail']]
+        digest = hashlib.sha256()
+        with open(old_archive, 'rb') as old_file, open(output_path, 'wb') as output_file:
+            for ops in segments:
+                for op in ops:
+                    if op[0] == 'old':
+                        old_file.seek(op[1])
+                        data = old_file.read(op[2])
+                        if len(data) != op[2]:
+                            raise ValueError("Delta references bytes beyond the end of the base archive")
+                    elif op[0] == 'chunk':
+                        data = delta_zip.read(CHUNKS_DIR + op[1])
+                    else:
+                        data = base64.b64decode(op[1])
+                    digest.update(data)
+                    output_file.write(data)
+
+    if digest.hexdigest() != manifest['new_sha256']:
+        raise ValueError("Digest mismatch for rebuilt archive")
+
+
+def _temp_path_in(directory, suffix):
+    fd, temp_name = tempfile.mkstemp(suffix=suffix, dir=directory)
+    os.close(fd)
+    return Path(temp_name)
+
+
+def create_delta(old_archive, new_archive, output_path=None):
+    """
+    Create a .skilldelta file that turns old_archive into new_archive.
+
+    The delta is applied to old_archive into a temporary file before it is
+    reported as created, so a delta that would not rebuild new_archive exactly
+    is never written.
+
+    Args:
+        old_archive: Path to the previous .skill file
+        new_archive: Path to the updated .skill file
+        output_path: Optional path for the delta (defaults to <new-name>.skilldelta in the current directory)
+
+    Returns:
+        Path to the created delta file, or None if error
+    """
+    old_archive = Path(old_archive).resolve()
+    new_archive = Path(new_archive).resolve()
+    for archive in (old_archive, new_archive):
+        if not archive.is_file():
+            print(f"❌ Error: Archive not found: {archive}")
+            return None
+
+    if output_path:
+        output_path = Path(output_path).resolve()
+    else:
+        output_path = Path.cwd() / f"{new_archive.stem}.skilldelta"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_delta = _temp_path_in(output_path.parent, '.skilldelta')
+    temp_rebuild = _temp_path_in(output_path.parent, '.skill')
+    try:
+        manifest, new_chunks = build_delta(old_archive, new_archive)
+        with zipfile.ZipFile(temp_delta, 'w', zipfile.ZIP_DEFLATED) as delta_zip:
+            delta_zip.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+            for chunk_hash, chunk in new_chunks.items():
+                delta_zip.writestr(CHUNKS_DIR + chunk_hash, chunk)
+        rebuild_archive(old_archive, temp_delta, temp_rebuild)
+        temp_delta.replace(output_path)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        temp_delta.unlink(missing_ok=True)
+        print(f"❌ Error creating delta: {e}")
+        return None
+    finally:
+        temp_rebuild.unlink(missing_ok=True)
+
+    for entry in manifest['entries']:
+        if entry['status'] != 'unchanged':
+            print(f"  {entry['status'].capitalize()}: {entry['filename']}")
+    for name in manifest['removed']:
+        print(f"  Removed: {name}")
+
+    delta_size = output_path.stat().st_size
+    new_size = new_archive.stat().st_size
+    print(f"\n✅ Created and verified delta: {output_path}")
+    print(f"   {delta_size} bytes ({delta_size / new_size:.1%} of the {new_size}-byte archive), "
+          f"{len(new_chunks)} new chunk(s)")
+    return output_path
+
+
+def apply_delta(old_archive, delta_path, output_path=None):
+    """
+    Apply a .skilldelta to an old archive and write the verified new archive.
+
+    Args:
+        old_archive: Path to the base .skill file
+        delta_path: Path to the .skilldelta file
+        output_path: Optional path for the rebuilt archive (defaults to <delta-name>.skill in the current directory)
+
+    Returns:
+        Path to the rebuilt .skill file, or None if error
+    """
+    old_archive = Path(old_archive).resolve()
+    delta_path = Path(delta_path).resolve()
+    for path in (old_archive, delta_path):
+        if not path.is_file():
+            print(f"❌ Error: File not found: {path}")
+            return None
+
+    if output_path:
+        output_path = Path(output_path).resolve()
+    else:
+        output_path = Path.cwd() / f"{delta_path.stem}.skill"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write next to the target and only replace it once the digest checks out
+    temp_path = _temp_path_in(output_path.parent, '.skill')
+    try:
+        rebuild_archive(old_archive, delta_path, temp_path)
+        temp_path.replace(output_path)
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        temp_path.unlink(missing_ok=True)
+        print(f"❌ Error applying delta: {e}")
+        return None
+
+    print(f"✅ Rebuilt and verified archive: {output_path}")
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or apply deltas between .skill archives")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create_parser = subparsers.add_parser('create', help="Create a delta from old to new archive")
+    create_parser.add_argument('old_archive')
+    create_parser.add_argument('new_archive')
+    create_parser.add_argument('output', nargs='?', help="Output .skilldelta path")
+
+    apply_parser = subparsers.add_parser('apply', help="Rebuild the new archive from old archive and delta")
+    apply_parser.add_argument('old_archive')
+    apply_parser.add_argument('delta')
+    apply_parser.add_argument('output', nargs='?', help="Output .skill path")
+
+    args = parser.parse_args()
+
+    if args.command == 'create':
+        result = create_delta(args.old_archive, args.new_archive, args.output)
+    else:
+        result = apply_delta(args.old_archive, args.delta, args.output)
+
+    sys.exit(0 if result else 1)
+
+
+if __name__ == "__main__":
+    main()
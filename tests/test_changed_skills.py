@@ -0,0 +1,80 @@
+
+import unittest
+import sys
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Add scripts directory to path
+current_dir = Path(__file__).resolve().parent
+scripts_dir = current_dir.parent / 'creating-skill-pro' / 'scripts'
+sys.path.append(str(scripts_dir))
+
+from changed_skills import changed_skills, find_skills
+
+class TestChangedSkills(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp()).resolve()
+        self.library = self.test_dir / 'skills'
+        self.templates = self.test_dir / 'templates'
+        self.templates.mkdir()
+        (self.templates / 'base.md').write_text("template")
+        for name in ('analyzing-data', 'creating-docs', 'testing-code'):
+            skill_dir = self.library / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / 'SKILL.md').write_text(f"---\nname: {name}\ndescription: test\n---")
+
+        self.git('init', '-q', '-b', 'main')
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'initial')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def git(self, *args):
+        subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=self.test_dir, check=True, capture_output=True,
+        )
+
+    def test_find_skills(self):
+        names = [skill.name for skill in find_skills(self.library)]
+        self.assertEqual(names, ['analyzing-data', 'creating-docs', 'testing-code'])
+
+    def test_no_changes(self):
+        self.assertEqual(changed_skills(self.library, 'main'), [])
+
+    def test_committed_and_untracked_changes(self):
+        self.git('checkout', '-q', '-b', 'feature')
+        (self.library / 'creating-docs' / 'SKILL.md').write_text("---\nname: creating-docs\ndescription: new\n---")
+        self.git('commit', '-q', '-am', 'change docs')
+        (self.library / 'testing-code' / 'notes.md').write_text("untracked")
+
+        names = [skill.name for skill in changed_skills(self.library, 'main')]
+        self.assertEqual(names, ['creating-docs', 'testing-code'])
+
+    def test_moved_file_selects_both_skills(self):
+        (self.library / 'analyzing-data' / 'ref.md').write_text("shared reference\n" * 20)
+        self.git('add', '-A')
+        self.git('commit', '-q', '-m', 'add reference')
+        self.git('branch', 'base')
+        self.git('mv', 'skills/analyzing-data/ref.md', 'skills/testing-code/ref.md')
+        self.git('commit', '-q', '-m', 'move reference')
+
+        names = [skill.name for skill in changed_skills(self.library, 'base')]
+        self.assertEqual(names, ['analyzing-data', 'testing-code'])
+
+    def test_shared_change_selects_all(self):
+        (self.templates / 'base.md').write_text("updated template")
+
+        self.assertEqual(changed_skills(self.library, 'main'), [])
+        selected = changed_skills(self.library, 'main', shared_paths=[self.templates])
+        self.assertEqual(selected, find_skills(self.library))
+
+    def test_unknown_revision(self):
+        with self.assertRaises(RuntimeError):
+            changed_skills(self.library, 'does-not-exist')
+
+if __name__ == '__main__':
+    unittest.main()
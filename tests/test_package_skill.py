@@ -2,9 +2,12 @@
 import unittest
 import sys
 import os
+import hashlib
 import shutil
 import tempfile
 import zipfile
+import zlib
+from unittest import mock
 from pathlib import Path
 
 # Add scripts directory to path
@@ -13,6 +16,7 @@ scripts_dir = current_dir.parent / 'creating-skill-pro' / 'scripts'
 sys.path.append(str(scripts_dir))
 
 from package_skill import package_skill
+from blob_store import BlobStore
 
 class TestPackageSkill(unittest.TestCase):
     def setUp(self):
@@ -61,5 +65,94 @@ class TestPackageSkill(unittest.TestCase):
         result = package_skill(Path(self.test_dir) / self.skill_name / 'non-existent')
         self.assertIsNone(result)
 
+    def test_package_skill_with_blob_store(self):
+        assets_dir = self.skill_dir / 'assets'
+        assets_dir.mkdir()
+        (assets_dir / 'logo.svg').write_text("<svg>" + "logo " * 2000 + "</svg>")
+
+        plain = package_skill(self.skill_dir, Path(self.test_dir) / 'plain')
+        store = BlobStore(Path(self.test_dir) / 'store')
+        cached = package_skill(self.skill_dir, Path(self.test_dir) / 'cached', store)
+
+        # Raw-copied entries are byte-identical to regular packaging
+        self.assertEqual(cached.read_bytes(), plain.read_bytes())
+        self.assertEqual((store.hits, store.misses), (0, 3))
+
+        # A second skill sharing the asset reuses the compressed blob
+        other_dir = Path(self.test_dir) / 'testing-other'
+        (other_dir / 'assets').mkdir(parents=True)
+        (other_dir / 'SKILL.md').write_text("---\nname: testing-other\ndescription: Another skill.\n---")
+        shutil.copy(assets_dir / 'logo.svg', other_dir / 'assets' / 'logo.svg')
+
+        result = package_skill(other_dir, Path(self.test_dir) / 'cached', store)
+        self.assertIsNotNone(result)
+        self.assertEqual((store.hits, store.misses), (1, 4))
+        self.assertGreater(store.dedupe_ratio(), 0)
+        with zipfile.ZipFile(result) as z:
+            self.assertIsNone(z.testzip())
+            self.assertEqual(z.read('testing-other/assets/logo.svg'), (assets_dir / 'logo.svg').read_bytes())
+
+    def test_blob_store_rewrites_corrupt_blob(self):
+        store_dir = Path(self.test_dir) / 'store'
+        package_skill(self.skill_dir, Path(self.test_dir) / 'first', BlobStore(store_dir))
+
+        blob = next(store_dir.glob('*/*.deflate'))
+        blob.write_bytes(blob.read_bytes()[:5])
+
+        store = BlobStore(store_dir)
+        result = package_skill(self.skill_dir, Path(self.test_dir) / 'second', store)
+        self.assertEqual((store.hits, store.misses), (1, 1))
+        with zipfile.ZipFile(result) as z:
+            self.assertIsNone(z.testzip())
+        # The truncated blob was replaced with a valid stream
+        self.assertEqual(hashlib.sha256(zlib.decompress(blob.read_bytes(), -15)).hexdigest(), blob.stem)
+
+    def test_blob_store_estimates_savings_when_fully_cached(self):
+        store_dir = Path(self.test_dir) / 'store'
+        first = BlobStore(store_dir)
+        package_skill(self.skill_dir, Path(self.test_dir) / 'first', first)
+        first.save_rate()
+
+        # No persisted rate and nothing compressed yet: report n/a, not zero
+        self.assertIn("n/a", BlobStore(Path(self.test_dir) / 'empty').summary())
+
+        cached = BlobStore(store_dir)
+        package_skill(self.skill_dir, Path(self.test_dir) / 'second', cached)
+        self.assertEqual(cached.misses, 0)
+        self.assertIsNotNone(cached.estimated_seconds_saved())
+        self.assertNotIn("n/a", cached.summary())
+
+    def test_blob_store_falls_back_for_zip64_sizes(self):
+        store = BlobStore(Path(self.test_dir) / 'store')
+        with mock.patch.object(zipfile, 'ZIP64_LIMIT', 10):
+            result = package_skill(self.skill_dir, Path(self.test_dir) / 'dist', store)
+        self.assertIsNotNone(result)
+        self.assertEqual(store.hits + store.misses, 0)
+        with zipfile.ZipFile(result) as z:
+            self.assertIsNone(z.testzip())
+
+    def test_blob_store_rejects_append_mode(self):
+        store = BlobStore(Path(self.test_dir) / 'store')
+        archive = Path(self.test_dir) / 'existing.skill'
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('testing-skill/README.md', "existing entry")
+
+        with zipfile.ZipFile(archive, 'a', zipfile.ZIP_DEFLATED) as z:
+            with self.assertRaises(ValueError):
+                store.write_file(z, self.skill_dir / 'SKILL.md', 'testing-skill/SKILL.md')
+
+        # The archive is untouched and still readable
+        with zipfile.ZipFile(archive) as z:
+            self.assertEqual(z.namelist(), ['testing-skill/README.md'])
+            self.assertIsNone(z.testzip())
+
+    def test_blob_store_falls_back_on_unsupported_python(self):
+        store = BlobStore(Path(self.test_dir) / 'store')
+        with mock.patch('blob_store.RAW_WRITE_VERSIONS', ((2, 0), (2, 7))):
+            result = package_skill(self.skill_dir, Path(self.test_dir) / 'dist', store)
+        self.assertEqual(store.hits + store.misses, 0)
+        with zipfile.ZipFile(result) as z:
+            self.assertIsNone(z.testzip())
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,6 +3,7 @@ import unittest
 import sys
 import os
 import shutil
+import subprocess
 import tempfile
 from pathlib import Path
 
@@ -11,7 +12,7 @@ current_dir = Path(__file__).resolve().parent
 scripts_dir = current_dir.parent / 'creating-skill-pro' / 'scripts'
 sys.path.append(str(scripts_dir))
 
-from quick_validate import validate_skill
+from quick_validate import validate_skill, select_rules, Rule, RULES
 
 class TestQuickValidate(unittest.TestCase):
     def setUp(self):
@@ -134,5 +135,97 @@ class TestQuickValidate(unittest.TestCase):
         self.assertTrue(valid)
         self.assertEqual(msg, "Skill is valid!")
 
+    def test_warning_severity_does_not_fail(self):
+        # 'test-skill' fails the gerund check, downgraded to a warning here
+        rules = select_rules(severities={'gerund-name': 'warning'})
+        self.create_skill_md("---\nname: test-skill\ndescription: test\n---")
+        warnings = []
+        valid, msg = validate_skill(self.skill_dir, rules, warnings=warnings)
+        self.assertTrue(valid)
+        self.assertEqual(len(warnings), 1)
+        self.assertIn("gerund form", warnings[0])
+
+    def test_spec_rule_set_skips_gerund(self):
+        self.create_skill_md("---\nname: test-skill\ndescription: test\n---")
+        valid, msg = validate_skill(self.skill_dir, select_rules('spec'))
+        self.assertTrue(valid)
+
+    def test_unknown_rule_set_and_rule_id(self):
+        with self.assertRaises(ValueError):
+            select_rules('nonexistent')
+        with self.assertRaises(ValueError):
+            select_rules(severities={'nonexistent': 'warning'})
+        with self.assertRaises(ValueError):
+            Rule('bad-severity', lambda ctx: None, 'fatal')
+
+    def test_plugin_rules(self):
+        plugin = Path(self.test_dir) / 'org_rules.py'
+        plugin.write_text(
+            "from quick_validate import Rule\n"
+            "RULES = [Rule('org-prefix', lambda ctx: None if (ctx.name or '').endswith('-skill') "
+            "else 'Name must end with -skill')]\n"
+        )
+        valid_dir = Path(self.test_dir) / 'testing-thing'
+        valid_dir.mkdir()
+        (valid_dir / 'SKILL.md').write_text("---\nname: testing-thing\ndescription: test\n---")
+
+        valid, msg = validate_skill(valid_dir, select_rules(plugins=[plugin]))
+        self.assertFalse(valid)
+        self.assertEqual(msg, "Name must end with -skill")
+
+    def test_plugin_rules_from_command_line(self):
+        plugin = Path(self.test_dir) / 'org_rules.py'
+        plugin.write_text(
+            "from quick_validate import Rule\n"
+            "RULES = [Rule('org-prefix', lambda ctx: 'Org rule failed', severity='warning')]\n"
+        )
+        valid_dir = Path(self.test_dir) / 'testing-thing'
+        valid_dir.mkdir()
+        (valid_dir / 'SKILL.md').write_text("---\nname: testing-thing\ndescription: test\n---")
+
+        result = subprocess.run(
+            [sys.executable, str(scripts_dir / 'quick_validate.py'), str(valid_dir), '--plugin', str(plugin)],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stdout)
+        self.assertIn("Warning: Org rule failed", result.stdout)
+
+    def test_broken_plugin(self):
+        plugin = Path(self.test_dir) / 'broken_rules.py'
+        plugin.write_text("RULES = [undefined_name]\n")
+        with self.assertRaisesRegex(ValueError, "broken_rules.py failed to load: NameError"):
+            select_rules(plugins=[plugin])
+
+        result = subprocess.run(
+            [sys.executable, str(scripts_dir / 'quick_validate.py'), str(self.skill_dir), '--plugin', str(plugin)],
+            capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("❌ Rule plugin broken_rules.py failed to load", result.stdout)
+        self.assertNotIn("Traceback", result.stderr)
+
+    def test_plugin_duplicate_rule_id(self):
+        plugin = Path(self.test_dir) / 'dup_rules.py'
+        plugin.write_text(
+            "from quick_validate import Rule\n"
+            "RULES = [Rule('gerund-name', lambda ctx: None)]\n"
+        )
+        with self.assertRaisesRegex(ValueError, "redefines rule id 'gerund-name'"):
+            select_rules('spec', plugins=[plugin])
+
+        other = Path(self.test_dir) / 'other_rules.py'
+        other.write_text(
+            "from quick_validate import Rule\n"
+            "RULES = [Rule('org-prefix', lambda ctx: None)]\n"
+        )
+        with self.assertRaisesRegex(ValueError, "redefines rule id 'org-prefix'"):
+            select_rules(plugins=[other, other])
+
+    def test_rule_timings(self):
+        self.create_skill_md("---\nname: test-skill\ndescription: test\n---")
+        timings = {}
+        validate_skill(self.skill_dir, timings=timings)
+        self.assertEqual(set(timings), set(RULES))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,144 @@
+
+import unittest
+import sys
+import os
+import random
+import shutil
+import subprocess
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+# Add scripts directory to path
+current_dir = Path(__file__).resolve().parent
+scripts_dir = current_dir.parent / 'creating-skill-pro' / 'scripts'
+sys.path.append(str(scripts_dir))
+
+import skill_delta
+from skill_delta import create_delta, apply_delta, chunk_boundaries
+from package_skill import package_skill
+
+class TestSkillDelta(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.asset = random.Random(0).randbytes(200_000)
+
+        self.old_archive = self.test_dir / 'old.skill'
+        with zipfile.ZipFile(self.old_archive, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('testing-skill/SKILL.md', "---\nname: testing-skill\ndescription: v1\n---")
+            z.writestr('testing-skill/assets/data.bin', self.asset)
+            z.writestr('testing-skill/references/old.md', "obsolete")
+
+        self.new_archive = self.test_dir / 'new.skill'
+        with zipfile.ZipFile(self.new_archive, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('testing-skill/SKILL.md', "---\nname: testing-skill\ndescription: v2\n---")
+            z.writestr('testing-skill/assets/data.bin', self.asset)
+            z.writestr('testing-skill/assets/copy.bin', self.asset)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def assert_round_trip(self, old_archive, new_archive, max_ratio=None):
+        delta = create_delta(old_archive, new_archive, self.test_dir / 'update.skilldelta')
+        self.assertIsNotNone(delta)
+        if max_ratio is not None:
+            self.assertLess(delta.stat().st_size, new_archive.stat().st_size * max_ratio)
+
+        # Applying never recompresses, so a different local zlib cannot matter
+        with mock.patch('zlib.compressobj', side_effect=AssertionError("recompressed")):
+            rebuilt = apply_delta(old_archive, delta, self.test_dir / 'rebuilt.skill')
+        self.assertIsNotNone(rebuilt)
+        self.assertEqual(rebuilt.read_bytes(), new_archive.read_bytes())
+        return delta
+
+    def test_chunk_boundaries_cover_data(self):
+        boundaries = chunk_boundaries(self.asset)
+        self.assertGreater(len(boundaries), 1)
+        self.assertEqual(sum(length for _, length in boundaries), len(self.asset))
+        self.assertEqual(chunk_boundaries(b''), [])
+
+    def test_round_trip(self):
+        delta = self.assert_round_trip(self.old_archive, self.new_archive, max_ratio=0.05)
+
+        manifest, _ = skill_delta.build_delta(self.old_archive, self.new_archive)
+        statuses = {entry['filename']: entry['status'] for entry in manifest['entries']}
+        self.assertEqual(statuses, {
+            'testing-skill/SKILL.md': 'modified',
+            'testing-skill/assets/data.bin': 'unchanged',
+            'testing-skill/assets/copy.bin': 'renamed',
+        })
+        self.assertEqual(manifest['removed'], ['testing-skill/references/old.md'])
+        self.assertTrue(delta.exists())
+
+    def test_round_trip_package_skill_archives(self):
+        skill_dir = self.test_dir / 'src' / 'testing-skill'
+        (skill_dir / 'assets').mkdir(parents=True)
+        (skill_dir / 'SKILL.md').write_text("---\nname: testing-skill\ndescription: A valid description.\n---")
+        (skill_dir / 'assets' / 'data.bin').write_bytes(self.asset)
+        (skill_dir / 'assets' / 'notes.md').write_text("notes\n" * 1000)
+        old_archive = package_skill(skill_dir, self.test_dir / 'v1')
+
+        # Doc fix plus a new timestamp on the unchanged asset
+        (skill_dir / 'assets' / 'notes.md').write_text("notes\n" * 1000 + "fixed typo\n")
+        os.utime(skill_dir / 'assets' / 'data.bin', (0, 315532800))
+        new_archive = package_skill(skill_dir, self.test_dir / 'v2')
+
+        self.assert_round_trip(old_archive, new_archive, max_ratio=0.05)
+
+    def test_round_trip_non_default_compresslevel(self):
+        text = "".join(f"line {i}: some compressible reference text\n" for i in range(20_000))
+        old_archive = self.test_dir / 'old9.skill'
+        new_archive = self.test_dir / 'new9.skill'
+        with zipfile.ZipFile(old_archive, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as z:
+            z.writestr('testing-skill/references/guide.md', text)
+        with zipfile.ZipFile(new_archive, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as z:
+            z.writestr('testing-skill/references/guide.md', text.replace("line 100:", "line 100 (edited):"))
+
+        self.assert_round_trip(old_archive, new_archive)
+
+    @unittest.skipUnless(shutil.which('zip'), "zip tool not installed")
+    def test_round_trip_zip_tool_archives(self):
+        skill_dir = self.test_dir / 'src' / 'testing-skill'
+        skill_dir.mkdir(parents=True)
+        (skill_dir / 'SKILL.md').write_text("---\nname: testing-skill\ndescription: v1\n---")
+        (skill_dir / 'data.bin').write_bytes(self.asset)
+
+        def zip_tool(archive):
+            # Streaming to a pipe makes zip write data descriptors
+            result = subprocess.run(['zip', '-qr', '-', 'testing-skill'],
+                                    cwd=skill_dir.parent, capture_output=True, check=True)
+            archive.write_bytes(result.stdout)
+            return archive
+
+        old_archive = zip_tool(self.test_dir / 'zip1.skill')
+        (skill_dir / 'SKILL.md').write_text("---\nname: testing-skill\ndescription: v2\n---")
+        new_archive = zip_tool(self.test_dir / 'zip2.skill')
+        with zipfile.ZipFile(new_archive) as z:
+            self.assertTrue(any(zinfo.flag_bits & 0x08 for zinfo in z.infolist()))
+
+        self.assert_round_trip(old_archive, new_archive, max_ratio=0.05)
+
+    def test_create_fails_when_rebuild_does_not_match(self):
+        output = self.test_dir / 'update.skilldelta'
+        with mock.patch.object(skill_delta, 'rebuild_archive', side_effect=ValueError("Digest mismatch")):
+            result = create_delta(self.old_archive, self.new_archive, output)
+        self.assertIsNone(result)
+        self.assertFalse(output.exists())
+        self.assertEqual(list(self.test_dir.glob('tmp*')), [])
+
+    def test_apply_to_wrong_base(self):
+        delta = create_delta(self.old_archive, self.new_archive, self.test_dir / 'update.skilldelta')
+        output = self.test_dir / 'rebuilt.skill'
+
+        result = apply_delta(self.new_archive, delta, output)
+        self.assertIsNone(result)
+        self.assertFalse(output.exists())
+        self.assertEqual(list(self.test_dir.glob('tmp*')), [])
+
+    def test_archive_not_found(self):
+        result = create_delta(self.test_dir / 'missing.skill', self.new_archive)
+        self.assertIsNone(result)
+
+if __name__ == '__main__':
+    unittest.main()